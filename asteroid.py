@@ -1,38 +1,37 @@
 import pygame
 import random
-from circleshape import CircleShape
+from pooledshape import PooledShape
 from constants import LINE_WIDTH, ASTEROID_MIN_RADIUS
 from logger import log_event
 
-class Asteroid(CircleShape):
-    def __init__(self, x, y, radius):
-        super().__init__(x, y, radius)
-
+class Asteroid(PooledShape):
     def draw(self, screen):
-        pygame.draw.circle(screen, "white", self.position, self.radius, LINE_WIDTH)
-
-    def update(self, dt):
-        self.position += self.velocity * dt
+        return pygame.draw.circle(screen, "white", self.position, self.radius, LINE_WIDTH)
     
     def split(self):
+        # read our state before kill() hands the slot back to the pool
+        position = self.position
+        velocity = self.velocity
+        radius = self.radius
+
         self.kill()
 
-        if self.radius<= ASTEROID_MIN_RADIUS:
+        if radius<= ASTEROID_MIN_RADIUS:
             return
 
         log_event("asteroid_split")
 
         angle = random.uniform(20,50)
 
-        velocity1 = self.velocity.rotate(angle)
-        velocity2 = self.velocity.rotate(-angle)
+        velocity1 = velocity.rotate(angle)
+        velocity2 = velocity.rotate(-angle)
 
         # compute new smaller radius
-        new_radius = self.radius - ASTEROID_MIN_RADIUS
+        new_radius = radius - ASTEROID_MIN_RADIUS
 
         # spawn two smaller asteroids at the same position
-        asteroid1 = Asteroid(self.position.x, self.position.y, new_radius)
-        asteroid2 = Asteroid(self.position.x, self.position.y, new_radius)
+        asteroid1 = Asteroid.create(position.x, position.y, new_radius)
+        asteroid2 = Asteroid.create(position.x, position.y, new_radius)
 
         # make them move faster
         asteroid1.velocity = velocity1 * 1.2
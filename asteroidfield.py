@@ -1,10 +1,11 @@
 import pygame
 import random
 from asteroid import Asteroid
+from pool import Pool
 from constants import *
 
 
-class AsteroidField(pygame.sprite.Sprite):
+class AsteroidField(Pool):
     edges = [
         [
             pygame.Vector2(1, 0),
@@ -28,15 +29,20 @@ class AsteroidField(pygame.sprite.Sprite):
         ],
     ]
 
-    def __init__(self):
-        pygame.sprite.Sprite.__init__(self, self.containers)
+    def __init__(self, capacity=128):
+        # the ship's centre is kept on screen, so its hull can poke out by
+        # PLAYER_RADIUS; don't cull an asteroid that could still touch it
+        super().__init__(capacity, margin=PLAYER_RADIUS)
         self.spawn_timer = 0.0
+        Asteroid.pool = self
 
     def spawn(self, radius, position, velocity):
-        asteroid = Asteroid(position.x, position.y, radius)
+        asteroid = Asteroid.create(position.x, position.y, radius)
         asteroid.velocity = velocity
 
     def update(self, dt):
+        super().update(dt)
+
         self.spawn_timer += dt
         if self.spawn_timer > ASTEROID_SPAWN_RATE_SECONDS:
             self.spawn_timer = 0
@@ -14,15 +14,9 @@ class CircleShape(pygame.sprite.Sprite):
         self.radius = radius
 
     def draw(self, screen):
-        # must override
+        # must override, returning the Rect that was drawn
         pass
 
     def update(self, dt):
         # must override
         pass
-
-    def collides_with(self, other):
-        distance = self.position.distance_to(other.position)
-        if distance <= self.radius + other.radius:
-            return True
-        return False
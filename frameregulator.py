@@ -0,0 +1,36 @@
+import time
+import pygame
+
+# OS sleeps can overshoot by several ms, so only sleep until this close to the
+# next frame and spin the rest of the way, pumping events while we wait
+SPIN_SECONDS = 0.002
+
+
+class FrameRegulator:
+    def __init__(self, fps):
+        self.frame_time = 1 / fps
+        self.last_tick = time.perf_counter()
+        self.next_tick = self.last_tick + self.frame_time
+
+    def tick(self):
+        """Wait for the next frame and return the seconds since the last tick"""
+        while True:
+            remaining = self.next_tick - time.perf_counter()
+            if remaining <= 0:
+                break
+            if remaining > SPIN_SECONDS:
+                time.sleep(remaining - SPIN_SECONDS)
+            else:
+                pygame.event.pump()
+                time.sleep(0)
+
+        now = time.perf_counter()
+        dt = now - self.last_tick
+        self.last_tick = now
+
+        # keep a fixed cadence, but don't race to catch up after a long stall
+        self.next_tick += self.frame_time
+        if self.next_tick < now:
+            self.next_tick = now + self.frame_time
+
+        return dt
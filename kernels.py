@@ -0,0 +1,37 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it these run as ordinary NumPy code
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+# Signatures are given so numba compiles at import instead of stalling the
+# first frame that calls each kernel; cache=True keeps that to the first run
+
+@njit("void(float32[:, ::1], float32[:, ::1], float64)", cache=True, fastmath=True)
+def integrate(pos, vel, dt):
+    """Advance every position by its velocity, in place"""
+    pos += vel * dt
+
+
+@njit("boolean(float32[:, ::1], float32[::1], float64, float64, float64)",
+      cache=True, fastmath=True)
+def touches_any(pos, radii, x, y, radius):
+    """Return True if the circle at (x, y) overlaps any of the given circles"""
+    dx = pos[:, 0] - x
+    dy = pos[:, 1] - y
+    reach = radii + radius
+    return bool(np.any(dx * dx + dy * dy <= reach * reach))
+
+
+@njit("int64[:, :](float32[:, ::1], float32[::1], float32[:, ::1], float32[::1])",
+      cache=True, fastmath=True)
+def circle_hits(a_pos, a_radii, b_pos, b_radii):
+    """Return (i, j) index pairs where circle a[i] overlaps circle b[j]"""
+    dx = a_pos[:, 0:1] - b_pos[:, 0]
+    dy = a_pos[:, 1:2] - b_pos[:, 1]
+    reach = a_radii[:, None] + b_radii
+    return np.argwhere(dx * dx + dy * dy <= reach * reach)
@@ -1,6 +1,11 @@
+import atexit
 import inspect
 import json
 import math
+import queue
+import threading
+import time
+import traceback
 from datetime import datetime
 
 __all__ = ["log_state", "log_event"]
@@ -8,15 +13,63 @@ __all__ = ["log_state", "log_event"]
 _FPS = 60
 _MAX_SECONDS = 16
 _SPRITE_SAMPLE_LIMIT = 10  # Maximum number of sprites to log per group
+_WRITE_BATCH_SIZE = 64  # Maximum number of records written per file open
 
 _frame_count = 0
-_state_log_initialized = False
-_event_log_initialized = False
-_start_time = datetime.now()
+_start_time = time.monotonic()
+
+# Records are serialized and written by a background thread so the game loop
+# never blocks on disk I/O; it only pays for a queue put.
+_queue = queue.Queue()
+_initialized_paths = set()
+
+
+def _write_batch(batch):
+    lines_by_path = {}
+    for path, entry in batch:
+        # one bad record shouldn't cost the rest of the batch
+        try:
+            line = json.dumps(entry) + "\n"
+        except Exception:
+            traceback.print_exc()
+            continue
+        lines_by_path.setdefault(path, []).append(line)
+
+    for path, lines in lines_by_path.items():
+        # New log file on each run
+        mode = "a" if path in _initialized_paths else "w"
+        with open(path, mode) as f:
+            f.write("".join(lines))
+        _initialized_paths.add(path)
+
+
+def _drain():
+    while True:
+        batch = [_queue.get()]
+        while len(batch) < _WRITE_BATCH_SIZE:
+            try:
+                batch.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            _write_batch(batch)
+        except Exception:
+            # keep draining, or the join at exit would wait forever
+            traceback.print_exc()
+        finally:
+            for _ in batch:
+                _queue.task_done()
+
+
+threading.Thread(target=_drain, name="logger", daemon=True).start()
+
+# Wait for queued records to reach disk before the interpreter exits
+atexit.register(_queue.join)
 
 
 def log_state():
-    global _frame_count, _state_log_initialized
+    global _frame_count
 
     # Stop logging after `_MAX_SECONDS` seconds
     if _frame_count > _FPS * _MAX_SECONDS:
@@ -101,35 +154,24 @@ def log_state():
 
     entry = {
         "timestamp": now.strftime("%H:%M:%S.%f")[:-3],
-        "elapsed_s": math.floor((now - _start_time).total_seconds()),
+        "elapsed_s": math.floor(time.monotonic() - _start_time),
         "frame": _frame_count,
         "screen_size": screen_size,
         **game_state,
     }
 
-    # New log file on each run
-    mode = "w" if not _state_log_initialized else "a"
-    with open("game_state.jsonl", mode) as f:
-        f.write(json.dumps(entry) + "\n")
-
-    _state_log_initialized = True
+    _queue.put_nowait(("game_state.jsonl", entry))
 
 
 def log_event(event_type, **details):
-    global _event_log_initialized
-
     now = datetime.now()
 
     event = {
         "timestamp": now.strftime("%H:%M:%S.%f")[:-3],
-        "elapsed_s": math.floor((now - _start_time).total_seconds()),
+        "elapsed_s": math.floor(time.monotonic() - _start_time),
         "frame": _frame_count,
         "type": event_type,
         **details,
     }
 
-    mode = "w" if not _event_log_initialized else "a"
-    with open("game_events.jsonl", mode) as f:
-        f.write(json.dumps(event) + "\n")
-
-    _event_log_initialized = True
+    _queue.put_nowait(("game_events.jsonl", event))
@@ -1,8 +1,10 @@
+import bisect
 import pygame
 import sys
 import random
 import json
 import os
+import numpy as np
 from datetime import datetime
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ASTEROID_MIN_RADIUS
 from logger import log_state, log_event
@@ -10,24 +12,57 @@ from player import Player
 from asteroid import Asteroid
 from asteroidfield import AsteroidField
 from shot import Shot
+from shotpool import ShotPool
+from frameregulator import FrameRegulator
+from kernels import touches_any, circle_hits
 
 HIGH_SCORES_FILE = "high_scores.json"
 
+# Redraw and present only the regions that changed instead of the whole
+# screen. Past DIRTY_RECT_LIMIT rects a full flip() is cheaper again.
+USE_DIRTY_RECTS = True
+DIRTY_RECT_LIMIT = 50
+
+BLACK = pygame.Color("black")  # resolved once instead of on every fill
+
+MAX_HIGH_SCORES = 5
+
+# Points per asteroid size tier; smaller asteroids are worth more
+SCORE_THRESHOLDS = (ASTEROID_MIN_RADIUS * 3, ASTEROID_MIN_RADIUS * 2)
+SCORE_POINTS = (100, 200, 300)
+
+_high_scores_cache = None
+
+def _rank_key(entry):
+    # bisect keeps the list ascending, so negate for highest score first
+    return -entry["score"]
+
 def load_high_scores():
-    """Load high scores from file, return empty list if file doesn't exist"""
-    if os.path.exists(HIGH_SCORES_FILE):
-        with open(HIGH_SCORES_FILE, 'r') as f:
-            return json.load(f)
-    return []
+    """Load high scores from file, return empty list if file doesn't exist.
+    The file is only read and sorted once per process; later calls return the
+    cached list"""
+    global _high_scores_cache
+    if _high_scores_cache is None:
+        if os.path.exists(HIGH_SCORES_FILE):
+            with open(HIGH_SCORES_FILE, 'r') as f:
+                _high_scores_cache = sorted(json.load(f), key=_rank_key)
+        else:
+            _high_scores_cache = []
+    return _high_scores_cache
 
 def save_high_scores(scores):
-    """Save high scores to file"""
-    with open(HIGH_SCORES_FILE, 'w') as f:
-        json.dump(scores, f, indent=2)
+    """Atomically save high scores to file and refresh the cache"""
+    global _high_scores_cache
+    tmp_file = HIGH_SCORES_FILE + ".tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(scores, f)
+    os.replace(tmp_file, HIGH_SCORES_FILE)
+    _high_scores_cache = scores
 
 def add_score(score, time_elapsed):
-    """Add new score and return rank (1-5) if it's a high score, otherwise None"""
-    high_scores = load_high_scores()
+    """Add new score and return (rank, high_scores); rank is 1-5 if it's a
+    high score, otherwise None"""
+    high_scores = list(load_high_scores())
     
     new_entry = {
         "score": score,
@@ -35,20 +70,50 @@ def add_score(score, time_elapsed):
         "date": datetime.now().strftime("%Y-%m-%d %H:%M")
     }
     
-    high_scores.append(new_entry)
-    high_scores.sort(key=lambda x: x["score"], reverse=True)
-    high_scores = high_scores[:5]  # Keep only top 5
-    
+    # insert after any equal scores, same as the old stable sort
+    bisect.insort(high_scores, new_entry, key=_rank_key)
+    rank = next(i for i, entry in enumerate(high_scores) if entry is new_entry) + 1
+
+    if rank > MAX_HIGH_SCORES:
+        return None, high_scores[:MAX_HIGH_SCORES]  # Not in top 5, nothing to save
+
+    high_scores = high_scores[:MAX_HIGH_SCORES]
     save_high_scores(high_scores)
-    
-    # Find rank of new score
-    for i, entry in enumerate(high_scores):
-        if (entry["score"] == score and 
-            entry["time"] == time_elapsed and 
-            entry["date"] == new_entry["date"]):
-            return i + 1  # Return rank (1-based)
-    
-    return None  # Not in top 5
+    return rank, high_scores
+
+def find_collisions(player, field, shot_pool):
+    """Return (player_hit, [(asteroid, shot), ...]) for this frame, with each
+    asteroid and shot appearing in at most one pair. Every pair is tested at
+    once; with off-screen shapes culled this beats a spatial broad phase at
+    any asteroid count the game reaches"""
+    live = np.flatnonzero(field.active)
+    if len(live) == 0:
+        return False, []
+
+    ast_pos = field.pos[live]
+    ast_radius = field.radii[live]
+
+    player_hit = touches_any(ast_pos, ast_radius, player.position.x, player.position.y, player.radius)
+
+    shot_live = np.flatnonzero(shot_pool.active)
+    if len(shot_live) == 0:
+        return player_hit, []
+
+    pairs = circle_hits(ast_pos, ast_radius, shot_pool.pos[shot_live], shot_pool.radii[shot_live])
+
+    # each asteroid and shot can only be used up once, so keep the first
+    # pair for each and drop the rest
+    hits = []
+    consumed_asteroids = set()
+    consumed_shots = set()
+    for i, j in pairs.tolist():
+        if i in consumed_asteroids or j in consumed_shots:
+            continue
+        consumed_asteroids.add(i)
+        consumed_shots.add(j)
+        hits.append((field.shapes[live[i]], shot_pool.shapes[shot_live[j]]))
+
+    return player_hit, hits
 
 def format_time(seconds):
     """Format seconds into MM:SS"""
@@ -62,18 +127,24 @@ def main():
     Player.containers = (updatable, drawable)
 
     asteroids = pygame.sprite.Group()
-    Asteroid.containers = (asteroids, updatable, drawable)
+    Asteroid.containers = (asteroids, drawable)
     AsteroidField.containers = (updatable,)
 
     shots = pygame.sprite.Group()
-    Shot.containers = (shots, updatable, drawable)
+    Shot.containers = (shots, drawable)
+    ShotPool.containers = (updatable,)
 
     pygame.init()
+    # QUIT and WINDOWEXPOSED are the only events we act on; dropping the rest
+    # in SDL means pygame never builds Event objects for them (mouse motion,
+    # key repeats, ...)
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.WINDOWEXPOSED])
     font = pygame.font.Font(None, 36)  # Add font for score display
     score = 0  # Initialize score
     start_time = pygame.time.get_ticks()
 
-    clock = pygame.time.Clock()
+    clock = FrameRegulator(60)
     dt = 0
     player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
     print(f"Starting Asteroids with pygame version: {pygame.version.ver}")
@@ -81,75 +152,94 @@ def main():
     print(f"Screen height: {SCREEN_HEIGHT}")
 
     asteroid_field = AsteroidField()
+    shot_pool = ShotPool()
+    load_high_scores()  # read the file now rather than on game over
 
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.flip()
+    dirty_rects = []  # regions drawn last frame
+    hud_score = hud_time = None
 
     while True:
+        now_ms = pygame.time.get_ticks()  # the frame's only clock read
         log_state()
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return
+        if pygame.event.peek(pygame.QUIT):
+            return
 
-        screen.fill("black")
+        if USE_DIRTY_RECTS:
+            for rect in dirty_rects:
+                screen.fill(BLACK, rect)
+        else:
+            screen.fill(BLACK)
         updatable.update(dt)
         
-        elapsed_time = (pygame.time.get_ticks() - start_time) / 1000.0
-
-        for asteroid in asteroids:
-            if player.collides_with(asteroid):
-                log_event("player_hit")
-
-                rank = add_score(score, elapsed_time)
-                high_scores = load_high_scores()
-
-                print("\n" + "="*50)
-                print("GAME OVER!")
-                print("="*50)
-                print(f"Your Score: {score}")
-                print(f"Time Survived: {format_time(elapsed_time)}")
-                print()
+        elapsed_time = (now_ms - start_time) * 0.001
 
-                if rank:
-                    print(f"🎉 NEW HIGH SCORE! You are #{rank} on the Leaderboard! 🎉")
-                    print()
-                
-                print("TOP 5 HIGH SCORES:")
-                print("-"*50)
-                for i, entry in enumerate(high_scores):
-                    marker = "→ " if (rank and i == rank - 1) else "  "
-                    print(f"{marker}{i+1}. Score: {entry['score']:>6} | Time: {format_time(entry['time'])} | {entry['date']}")
-                print("="*50 + "\n")
-
-                sys.exit()
-        
-        for asteroid in asteroids:
-            for shot in shots:
-                if asteroid.collides_with(shot):
-                    if asteroid.radius >= ASTEROID_MIN_RADIUS * 3:  # Large
-                        score += 100
-                    elif asteroid.radius >= ASTEROID_MIN_RADIUS * 2:  # Medium
-                        score += 200
-                    else:  # Small
-                        score += 300
-                    
-                    log_event("asteroid_shot")
-                    asteroid.split()
-                    shot.kill()
-                    break
-        
+        player_hit, hits = find_collisions(player, asteroid_field, shot_pool)
 
-        for sprite in drawable:
-            sprite.draw(screen)
+        if player_hit:
+            log_event("player_hit")
 
-        score_text = font.render(f"Score: {score}", True, "white")
-        time_text = font.render(f"Time: {format_time(elapsed_time)}", True, "red")
-        screen.blit(score_text, (10, 10))
-        screen.blit(time_text, (10, 50))
+            rank, high_scores = add_score(score, elapsed_time)
 
-        pygame.display.flip()
+            print("\n" + "="*50)
+            print("GAME OVER!")
+            print("="*50)
+            print(f"Your Score: {score}")
+            print(f"Time Survived: {format_time(elapsed_time)}")
+            print()
 
-        dt = clock.tick(60) / 1000
+            if rank:
+                print(f"🎉 NEW HIGH SCORE! You are #{rank} on the Leaderboard! 🎉")
+                print()
+                
+            print("TOP 5 HIGH SCORES:")
+            print("-"*50)
+            for i, entry in enumerate(high_scores):
+                marker = "→ " if (rank and i == rank - 1) else "  "
+                print(f"{marker}{i+1}. Score: {entry['score']:>6} | Time: {format_time(entry['time'])} | {entry['date']}")
+            print("="*50 + "\n")
+
+            sys.exit()
+
+        for asteroid, shot in hits:
+            # tier 0 = large, 1 = medium, 2 = small
+            radius = asteroid.radius
+            score += SCORE_POINTS[(radius < SCORE_THRESHOLDS[0]) + (radius < SCORE_THRESHOLDS[1])]
+
+            log_event("asteroid_shot")
+            asteroid.split()
+            shot.kill()
+
+        # sprites drawn off-screen come back as zero-size rects; skip those
+        drawn_rects = [rect for sprite in drawable if (rect := sprite.draw(screen))]
+
+        # only re-rasterize HUD text when its value changes
+        if score != hud_score:
+            hud_score = score
+            score_text = font.render(f"Score: {score}", True, "white")
+        time_str = format_time(elapsed_time)
+        if time_str != hud_time:
+            hud_time = time_str
+            time_text = font.render(f"Time: {time_str}", True, "red")
+        drawn_rects.append(screen.blit(score_text, (10, 10)))
+        drawn_rects.append(screen.blit(time_text, (10, 50)))
+
+        # erased regions need presenting too, or old frames linger on screen
+        update_rects = dirty_rects + drawn_rects
+        # the window system may have thrown away what it showed (uncovered or
+        # restored), so repaint all of it once rather than just the dirty rects
+        exposed = pygame.event.peek(pygame.WINDOWEXPOSED)
+        if exposed:
+            pygame.event.clear(pygame.WINDOWEXPOSED)
+        if USE_DIRTY_RECTS and not exposed and len(update_rects) <= DIRTY_RECT_LIMIT:
+            pygame.display.update(update_rects)
+        else:
+            pygame.display.flip()
+        dirty_rects = drawn_rects
+
+        dt = clock.tick()
 
 if __name__ == "__main__":
     main()
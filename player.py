@@ -1,6 +1,6 @@
 import pygame
 from circleshape import CircleShape
-from constants import PLAYER_RADIUS, LINE_WIDTH, PLAYER_TURN_SPEED, PLAYER_SPEED, SHOT_RADIUS, PLAYER_SHOOT_SPEED, PLAYER_SHOOT_COOLDOWN_SECONDS 
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, PLAYER_RADIUS, LINE_WIDTH, PLAYER_TURN_SPEED, PLAYER_SPEED, SHOT_RADIUS, PLAYER_SHOOT_SPEED, PLAYER_SHOOT_COOLDOWN_SECONDS 
 from shot import Shot
 
 
@@ -21,7 +21,7 @@ class Player(CircleShape):
         return [a, b, c]
 
     def draw(self, screen):
-        pygame.draw.polygon(screen, "white", self.triangle(), LINE_WIDTH)
+        return pygame.draw.polygon(screen, "white", self.triangle(), LINE_WIDTH)
 
     def rotate(self, dt):
         self.rotation += PLAYER_TURN_SPEED * dt 
@@ -53,11 +53,16 @@ class Player(CircleShape):
         rotated_with_speed_vector = rotated_vector * PLAYER_SPEED * dt
         self.position += rotated_with_speed_vector
 
+        # keep the ship's centre on screen; anything that leaves the screen
+        # heading away is culled, so the ship must not follow it out
+        self.position.x = pygame.math.clamp(self.position.x, 0, SCREEN_WIDTH)
+        self.position.y = pygame.math.clamp(self.position.y, 0, SCREEN_HEIGHT)
+
     def shoot(self):
         if self.shoot_cooldown > 0:
             return
 
-        shot = Shot(self.position.x, self.position.y, SHOT_RADIUS)
+        shot = Shot.create(self.position.x, self.position.y, SHOT_RADIUS)
         shot.velocity = pygame.Vector2(0, 1).rotate(self.rotation) * PLAYER_SHOOT_SPEED
 
         self.shoot_cooldown = PLAYER_SHOOT_COOLDOWN_SECONDS
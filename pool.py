@@ -0,0 +1,80 @@
+import numpy as np
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from kernels import integrate
+
+
+# Base class for object pools. The state of every pooled shape lives here as
+# parallel float32 arrays (one slot per shape) so the whole pool moves with a
+# single vector op; the shapes themselves only hold a slot index. Shapes that
+# are more than `margin` off the screen and still heading away from it can
+# never come back, so they are killed; a pool only grows past its initial
+# capacity if that many shapes are in play at once.
+class Pool(pygame.sprite.Sprite):
+    def __init__(self, capacity, margin=0):
+        if hasattr(self, "containers"):
+            super().__init__(self.containers)
+        else:
+            super().__init__()
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.radii = np.zeros(capacity, dtype=np.float32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.shapes = [None] * capacity
+        self.free = list(range(capacity - 1, -1, -1))
+        self.margin = margin
+
+        # killed sprites wait a frame in `released` before they can be reused,
+        # so stale references from this frame's collision pass stay dead
+        self.released = []
+        self.spare = []
+
+    def acquire(self, shape):
+        if not self.free:
+            self.grow()
+        index = self.free.pop()
+        self.active[index] = True
+        self.shapes[index] = shape
+        return index
+
+    def release(self, shape):
+        index = shape.index
+        self.active[index] = False
+        self.vel[index] = 0
+        self.shapes[index] = None
+        self.free.append(index)
+        self.released.append(shape)
+
+    def grow(self):
+        capacity = len(self.active)
+        self.pos = np.concatenate((self.pos, np.zeros_like(self.pos)))
+        self.vel = np.concatenate((self.vel, np.zeros_like(self.vel)))
+        self.radii = np.concatenate((self.radii, np.zeros_like(self.radii)))
+        self.active = np.concatenate((self.active, np.zeros_like(self.active)))
+        self.shapes.extend([None] * capacity)
+        self.free.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+    def update(self, dt):
+        # free slots have zero velocity, so no need to mask by `active`
+        integrate(self.pos, self.vel, dt)
+
+        self.spare.extend(self.released)
+        self.released.clear()
+
+        self.cull()
+
+    def cull(self):
+        """Kill every shape that is wholly more than `margin` off the screen
+        and moving away from it along that axis"""
+        x = self.pos[:, 0]
+        y = self.pos[:, 1]
+        vx = self.vel[:, 0]
+        vy = self.vel[:, 1]
+        reach = self.radii + self.margin
+        outside = self.active & (
+            ((x + reach < 0) & (vx <= 0)) | ((x - reach > SCREEN_WIDTH) & (vx >= 0)) |
+            ((y + reach < 0) & (vy <= 0)) | ((y - reach > SCREEN_HEIGHT) & (vy >= 0))
+        )
+        for index in np.flatnonzero(outside).tolist():
+            self.shapes[index].kill()
@@ -0,0 +1,58 @@
+import pygame
+from circleshape import CircleShape
+
+
+# A CircleShape whose position, velocity and radius live in a slot of `pool`
+class PooledShape(CircleShape):
+    pool = None  # set by the Pool that owns this class's slots
+
+    def __init__(self, x, y, radius):
+        self.index = self.pool.acquire(self)
+        super().__init__(x, y, radius)
+
+    @classmethod
+    def create(cls, x, y, radius):
+        """Return a shape at (x, y), reusing a killed one when the pool has it"""
+        if not cls.pool.spare:
+            return cls(x, y, radius)
+
+        shape = cls.pool.spare.pop()
+        shape.index = cls.pool.acquire(shape)
+        shape.add(*shape.containers)
+        shape.position = (x, y)
+        shape.velocity = (0, 0)
+        shape.radius = radius
+        return shape
+
+    @property
+    def position(self):
+        return pygame.Vector2(self.pool.pos[self.index].tolist())
+
+    @position.setter
+    def position(self, value):
+        self.pool.pos[self.index] = value
+
+    @property
+    def velocity(self):
+        return pygame.Vector2(self.pool.vel[self.index].tolist())
+
+    @velocity.setter
+    def velocity(self, value):
+        self.pool.vel[self.index] = value
+
+    @property
+    def radius(self):
+        return float(self.pool.radii[self.index])
+
+    @radius.setter
+    def radius(self, value):
+        self.pool.radii[self.index] = value
+
+    def update(self, dt):
+        # the pool moves every shape at once
+        pass
+
+    def kill(self):
+        if self.alive():
+            self.pool.release(self)
+        super().kill()
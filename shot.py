@@ -1,13 +1,7 @@
 import pygame
-from circleshape import CircleShape
-from constants import SHOT_RADIUS, LINE_WIDTH
-
-class Shot(CircleShape):
-    def __init__(self, x, y, radius):
-        super().__init__(x, y, radius)
+from pooledshape import PooledShape
+from constants import LINE_WIDTH
 
+class Shot(PooledShape):
     def draw(self, screen):
-        pygame.draw.circle(screen, "yellow", self.position, self.radius, LINE_WIDTH)
-
-    def update(self, dt):
-        self.position += self.velocity * dt
+        return pygame.draw.circle(screen, "yellow", self.position, self.radius, LINE_WIDTH)
@@ -0,0 +1,8 @@
+from pool import Pool
+from shot import Shot
+
+
+class ShotPool(Pool):
+    def __init__(self, capacity=64):
+        super().__init__(capacity)
+        Shot.pool = self